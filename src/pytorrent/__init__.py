@@ -0,0 +1,6 @@
+from .client import Torrent
+from .session import Session
+from .torrent_downloader import TorrentDownloader
+from .torrent_info import TorrentInfo
+
+__all__ = ["Session", "Torrent", "TorrentDownloader", "TorrentInfo"]
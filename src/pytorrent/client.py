@@ -0,0 +1,45 @@
+import asyncio
+import pathlib
+
+from .session import Session
+from .torrent_info import TorrentInfo
+from .torrent_downloader import TorrentDownloader
+import libtorrent as lt
+
+
+_default_session = None
+
+
+def get_default_session():
+    """Return the Session shared by every Torrent created without an explicit one"""
+    global _default_session
+    if _default_session is None:
+        _default_session = Session(libtorrent=lt)
+    return _default_session
+
+
+class Torrent:
+    __slots__ = ('_path', '_session', '_info')
+
+    def __init__(self, file_path, session=None):
+        self._path = pathlib.Path(file_path)
+        self._session = session or get_default_session()
+        self._info = None
+
+    @property
+    def info(self):
+        """Torrent metadata, parsed on first access"""
+        if self._info is None:
+            self._info = TorrentInfo(path=str(self._path), libtorrent=lt, session=self._session)
+        return self._info
+
+    async def preload_async(self):
+        """Parse the torrent metadata in a worker thread so the event loop is not blocked"""
+        # Gathering several preloads keeps the loop responsive, but the parses themselves
+        # only overlap where the libtorrent build releases the GIL while decoding
+        if self._info is None:
+            self._info = await asyncio.to_thread(
+                TorrentInfo, path=str(self._path), libtorrent=lt, session=self._session
+            )
+        return self._info
+    
@@ -19,18 +19,25 @@ class Downloader:
         self._paused = False
 
     def status(self):
-        if not self._is_magnet:
-            self._file = self._session.add_torrent({'ti': self._torrent_info, 'save_path': f'{self._save_path}'})
-            self._status = self._file.status()
-        else:
-            self._add_torrent_params = self._torrent_info
-            self._add_torrent_params.save_path = self._save_path
-            self._file = self._session.add_torrent(self._add_torrent_params)
-            self._status = self._file.status()
-            while(not self._file.has_metadata()):
-                time.sleep(1)
+        if self._file is None:
+            self._file = self._add_torrent()
+        self._status = self._file.status()
         return self._status
 
+    def _add_torrent(self):
+        # Add the torrent once and reuse the handle; a torrent already in the session keeps its handle
+        if not self._is_magnet:
+            handle = self._session.find_torrent(self._torrent_info.info_hash())
+            if handle.is_valid():
+                return handle
+            return self._session.add_torrent({'ti': self._torrent_info, 'save_path': f'{self._save_path}'})
+        self._add_torrent_params = self._torrent_info
+        self._add_torrent_params.save_path = self._save_path
+        handle = self._session.add_torrent(self._add_torrent_params)
+        while(not handle.has_metadata()):
+            time.sleep(1)
+        return handle
+
     @property
     def name(self):
         self._name = self.status().name
@@ -99,12 +106,3 @@ class Downloader:
 
     def is_paused(self):
         return self._paused
-
-    def __str__(self):
-        pass
-
-    def __repr__(self):
-        pass
-
-    def __call__(self):
-        pass
@@ -0,0 +1,1331 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import os
+import threading
+import time
+
+import libtorrent as lt
+
+# libtorrent keeps rate limits in a signed 32-bit int of bytes per second.
+MAX_RATE_LIMIT = (2 ** 31 - 1) >> 10
+
+# libtorrent rate values that map back to the KB/s sentinels 0 (unlimited) and -1 (minimal).
+_RATE_SENTINELS_DECODE = {-1: 0, 0: 0, 1: -1}
+
+# Alert classes and categories used on the alert path, resolved once at import. A
+# libtorrent build lacking one leaves it None, so its handler simply never fires.
+_ADD_TORRENT = getattr(lt, 'add_torrent_alert', None)
+_REMOVED = getattr(lt, 'torrent_removed_alert', None)
+_FINISHED = getattr(lt, 'torrent_finished_alert', None)
+_STATE_UPDATE = getattr(lt, 'state_update_alert', None)
+_DHT_PEERS = getattr(lt, 'dht_get_peers_reply_alert', None)
+_CATEGORY = lt.alert.category_t
+_STATUS_MASK = _CATEGORY.status_notification
+_DHT_OPERATION_MASK = _CATEGORY.dht_operation_notification
+_DEFAULT_ALERT_MASK = (_CATEGORY.error_notification | _STATUS_MASK
+                       | _CATEGORY.storage_notification | _CATEGORY.performance_warning)
+
+
+class Session:
+    """
+    Represents a torrent session using libtorrent. Manages session settings, rate limits,
+    network interfaces, and provides methods to interact with the torrent ecosystem.
+    """
+
+    __slots__ = (
+        # Configuration
+        '_user_agent', '_listen_interfaces', '_port', '_listen_spec', '_lt', '_settings',
+        # Staged settings and the rate limits installed in libtorrent
+        '_pending', '_batch_depth', '_lock', '_dl_cache', '_ul_cache', '_rate_hysteresis',
+        '_seeding_choker', '_leeching',
+        # Alert handling and the state it maintains
+        '_alert_handlers', '_alert_task', '_alert_pump', '_alert_consumer', '_alert_hook',
+        '_pending_adds', '_handles_by_hash',
+        '_status_cache', '_status_timer', '_dht_peers_cache', '_dht_cache_ttl',
+        '_dht_cache_size',
+        # The libtorrent session itself
+        '_session',
+    )
+
+    _REPR = ("Session(user_agent=%r, listen_interfaces=%r, port=%r, "
+             "download_rate_limit=%r, upload_rate_limit=%r)")
+
+    def __init__(self, 
+                 libtorrent=lt, 
+                 user_agent="Python client v1.0.0",
+                 listen_interfaces="0.0.0.0", 
+                 port: int = 6881,
+                 download_rate_limit=0,
+                 upload_rate_limit=0,
+                 rate_hysteresis=0.0,
+                 socket_buffer_size=4 * 1024 * 1024,
+                 connections_limit=800,
+                 active_limit=30,
+                 active_seeds=20,
+                 active_downloads=10,
+                 unchoke_slots_limit=16,
+                 disk_buffer_count=16,
+                 disk_buffer_size=16 * 1024 * 1024,
+                 alert_mask=None,
+                 dht_cache_ttl=30.0,
+                 dht_cache_size=4096,
+                 settings_pack=None,
+                 session=None) -> None:
+        """
+        Initializes the Session object with default or specified parameters.
+
+        Args:
+            libtorrent: The libtorrent library instance.
+            user_agent (str): The user agent string identifying the client.
+            listen_interfaces (str | list): Network interfaces to listen on, either as a
+                                            comma-separated string of hosts that all use
+                                            `port`, or as a list of (host, port) tuples.
+            port (int): Port number for incoming connections, between 1 and 65535.
+            download_rate_limit (int): Download rate limit in KB/s. 0 for unlimited.
+                                       At most MAX_RATE_LIMIT.
+            upload_rate_limit (int): Upload rate limit in KB/s. 0 for unlimited.
+                                     At most MAX_RATE_LIMIT.
+            rate_hysteresis (float): Relative change below which set_limits() leaves an
+                                     installed throttle alone, e.g. 0.1 ignores changes
+                                     within 10%. 0 applies every change.
+            socket_buffer_size (int): Size of the send and receive socket buffers in bytes.
+            connections_limit (int): Maximum number of peer connections.
+            active_limit (int): Maximum number of active torrents.
+            active_seeds (int): Maximum number of active seeding torrents.
+            active_downloads (int): Maximum number of active downloading torrents.
+            unchoke_slots_limit (int): Maximum number of unchoked peers.
+            disk_buffer_count (int): Number of disk buffers libtorrent may queue.
+            disk_buffer_size (int): Size of each disk buffer in bytes. Together with
+                                    disk_buffer_count it bounds queued disk bytes, and
+                                    it sets the send buffer watermark. libtorrent 2.x
+                                    has no disk cache of its own; the OS page cache
+                                    behind its mmap storage takes that role.
+            alert_mask (int): Alert categories libtorrent should post. None for errors,
+                              status, storage and performance warnings.
+            dht_cache_ttl (float): Seconds a DHT peer lookup result is reused by
+                                   dht_get_peers().
+            dht_cache_size (int): Maximum number of info hashes whose DHT peers are
+                                  cached; the oldest lookups are evicted first.
+            settings_pack (dict): Extra libtorrent settings merged over the defaults
+                                  when the session is created.
+            session: Existing libtorrent session object. If None, a new session is created.
+        """
+        self._user_agent = user_agent
+        self._listen_interfaces = listen_interfaces
+        self._port = port
+        self._listen_spec = self._build_listen_spec(listen_interfaces, port)
+        dl = self._check_rate(download_rate_limit)
+        ul = self._check_rate(upload_rate_limit)
+        self._rate_hysteresis = rate_hysteresis
+        self._pending = {}
+        self._batch_depth = 0
+        # Alert handlers stage settings from the pump and status threads too.
+        self._lock = threading.RLock()
+        self._lt = libtorrent
+        if alert_mask is None:
+            alert_mask = _DEFAULT_ALERT_MASK
+        cpus = os.cpu_count() or 1
+        self._settings = libtorrent.high_performance_seed()
+        self._settings.update({
+            'listen_interfaces': self._listen_spec,
+            'send_socket_buffer_size': socket_buffer_size,
+            'recv_socket_buffer_size': socket_buffer_size,
+            'connections_limit': connections_limit,
+            'active_limit': active_limit,
+            'active_seeds': active_seeds,
+            'active_downloads': active_downloads,
+            'unchoke_slots_limit': unchoke_slots_limit,
+            'max_queued_disk_bytes': disk_buffer_count * disk_buffer_size,
+            'piece_extent_affinity': True,
+            'send_buffer_watermark': disk_buffer_size,
+            'send_buffer_watermark_factor': 150,
+            'aio_threads': cpus,
+            'hashing_threads': max(2, cpus // 2),
+            'choking_algorithm': libtorrent.choking_algorithm_t.rate_based_choker,
+            'mixed_mode_algorithm': libtorrent.bandwidth_mixed_algo_t.prefer_tcp,
+            'rate_limit_ip_overhead': True,
+            'peer_connect_timeout': 7,
+            'download_rate_limit': self._encode_rate(dl),
+            'upload_rate_limit': self._encode_rate(ul),
+            'alert_mask': alert_mask,
+        })
+        self._settings.update(settings_pack or {})
+        self._alert_handlers = {}
+        self._alert_task = None
+        self._alert_pump = None
+        # Popping invalidates the previous batch, so only one consumer may pop at a time.
+        self._alert_consumer = None
+        self._alert_hook = None
+        self._seeding_choker = False
+        # Info hashes of torrents still downloading, kept by the add, finished and removed alerts.
+        self._leeching = set()
+        self._pending_adds = {}
+        self._handles_by_hash = {}
+        self._status_cache = {}
+        self._status_timer = None
+        self._dht_peers_cache = {}
+        self._dht_cache_ttl = dht_cache_ttl
+        self._dht_cache_size = dht_cache_size
+        self.add_alert_handler(_FINISHED, self._on_torrent_finished)
+        self.add_alert_handler(_ADD_TORRENT, self._on_add_torrent)
+        self.add_alert_handler(_REMOVED, self._on_torrent_removed)
+        self.add_alert_handler(_STATE_UPDATE, self._on_state_update)
+        self.add_alert_handler(_DHT_PEERS, self._on_dht_peers)
+        self._session = session if session is not None else self._build_session()
+        if session is not None:
+            # Limits installed on an existing session are unknown, so never skip the first update.
+            self._dl_cache = self._ul_cache = None
+        else:
+            self._dl_cache = self._settings['download_rate_limit']
+            self._ul_cache = self._settings['upload_rate_limit']
+
+    def _build_session(self):
+        """
+        Builds a new libtorrent session from the current settings without touching self.
+
+        Returns:
+            libtorrent.session: The new libtorrent session object.
+        """
+        return self._lt.session(self._settings)
+
+    def create_session(self):
+        """
+        Creates a new libtorrent session with the specified listen interfaces and port,
+        replacing the current one.
+
+        The settings are built once in __init__ from libtorrent's high performance
+        seed preset plus the constructor's tuning and rate limits, and flush() keeps
+        them current, so a recreated session keeps every change. Rate limiting is
+        left entirely to libtorrent, which also counts IP overhead against the limits.
+        Disk I/O stays on libtorrent's default backend (mmap on Linux), with the disk
+        and hashing thread pools sized to the machine. The notification hook of a
+        running alert pump, run() or alert eventfd is installed on the new session.
+
+        Returns:
+            libtorrent.session: The created libtorrent session object.
+        """
+        with self._lock:
+            old, self._session = self._session, self._build_session()
+            if self._alert_hook is not None:
+                # The running alert consumer waits on the hook, so move it to the new session.
+                old.set_alert_notify(lambda: None)
+                setter, arg = self._alert_hook
+                getattr(self._session, setter)(arg)
+        self._dl_cache = self._settings['download_rate_limit']
+        self._ul_cache = self._settings['upload_rate_limit']
+        # Handles, statuses and pending adds all belonged to the replaced session.
+        with self._lock:
+            pending_adds, self._pending_adds = self._pending_adds, {}
+        for futures in pending_adds.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(RuntimeError("session was replaced before the torrent was added"))
+        self._handles_by_hash.clear()
+        self._status_cache.clear()
+        self._leeching.clear()
+        return self._session
+
+    @staticmethod
+    def _build_listen_spec(listen_interfaces, port):
+        """
+        Normalises the listen interfaces into libtorrent's "host:port,host:port" syntax.
+
+        Args:
+            listen_interfaces (str | list): Comma-separated hosts or (host, port) tuples.
+            port (int): Port used for hosts given as a string.
+
+        Returns:
+            str: The listen_interfaces setting value.
+
+        Raises:
+            TypeError: If a port is not an int.
+            ValueError: If a port is outside [1, 65535].
+        """
+        if isinstance(listen_interfaces, str):
+            listen_interfaces = [(host.strip(), port) for host in listen_interfaces.split(',')]
+        for _, p in listen_interfaces:
+            if isinstance(p, bool) or not isinstance(p, int):
+                raise TypeError(f"port must be an int, got {type(p).__name__}")
+            if not 0 < p < 65536:
+                raise ValueError(f"port must be between 1 and 65535, got {p}")
+        return ','.join(f'{host}:{p}' for host, p in listen_interfaces)
+
+    @staticmethod
+    def _check_rate(rate):
+        """
+        Validates a rate limit given in KB/s.
+
+        Args:
+            rate (int): Rate limit in KB/s, -1 for minimal or 0 for unlimited.
+
+        Returns:
+            int: The validated rate.
+
+        Raises:
+            ValueError: If the rate is outside [-1, MAX_RATE_LIMIT].
+        """
+        if not -1 <= rate <= MAX_RATE_LIMIT:
+            raise ValueError(f"rate limit must be between -1 and {MAX_RATE_LIMIT} KB/s, got {rate}")
+        return rate
+
+    @staticmethod
+    def _encode_rate(rate):
+        """
+        Converts a rate limit in KB/s into the value libtorrent expects.
+
+        Args:
+            rate (int | float): Rate limit in KB/s, -1 for minimal or 0 for unlimited.
+                                Fractional rates such as a parsed CLI value are
+                                truncated to whole bytes per second.
+
+        Returns:
+            int: The rate limit in bytes per second as understood by libtorrent.
+        """
+        if rate > 0:
+            # A fraction too small for one byte per second still throttles.
+            return max(int(rate * 1024), 1)
+        return 1 if rate == -1 else -1
+
+    @staticmethod
+    def _decode_rate(value):
+        """
+        Converts a libtorrent rate limit back into KB/s, the inverse of _encode_rate.
+
+        Args:
+            value (int): Rate limit in bytes per second as reported by libtorrent.
+
+        Returns:
+            int: The rate limit in KB/s, -1 for minimal or 0 for unlimited. Limits that
+                 are not a whole number of KB/s round up, so a throttle below 1 KB/s
+                 never reads back as unlimited.
+        """
+        rate = _RATE_SENTINELS_DECODE.get(value)
+        return rate if rate is not None else (value + 1023) >> 10
+
+    def flush(self):
+        """
+        Pushes all staged settings to libtorrent in a single apply_settings call.
+
+        The batch is taken out of staging before libtorrent sees it, so a rejected
+        setting is dropped together with its batch instead of failing every later
+        flush. The stored settings and the tracked rate limits only change once
+        libtorrent has accepted the batch.
+        """
+        with self._lock:
+            pending = self._pending
+            if not pending:
+                return
+            self._pending = {}
+            self._session.apply_settings(pending)
+            self._settings.update(pending)
+            if 'download_rate_limit' in pending:
+                self._dl_cache = pending['download_rate_limit']
+            if 'upload_rate_limit' in pending:
+                self._ul_cache = pending['upload_rate_limit']
+
+    @contextlib.contextmanager
+    def configure(self):
+        """
+        Batches setting changes made inside the block into one libtorrent call.
+
+        Setters called inside `with session.configure():` only stage their values;
+        everything staged is flushed together when the outermost block exits. This
+        covers set_limits(), set_download_limit(), set_upload_limit(),
+        set_download_rate_limit(), set_upload_rate_limit(), set_max_connections()
+        and set_max_uploads().
+
+        The block holds the session's settings lock, so alert handlers running on
+        the pump or status thread wait for the batch instead of flushing it half
+        built. For that reason, do not stop those threads inside the block;
+        add_torrents() and add_torrents_async() raise RuntimeError there, and
+        submit_torrents() is the way to add torrents inside a batch.
+
+        Yields:
+            Session: The session itself.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    def apply_settings(self, settings):
+        """
+        Applies settings to the session.
+
+        The settings are staged like every other change, so they batch inside
+        configure() and survive create_session(), and installed rate limits stay
+        tracked.
+
+        Args:
+            settings: A dictionary of settings to apply.
+        """
+        with self.configure():
+            for name, value in settings.items():
+                self._stage(name, value)
+
+    def set_alert_mask(self, mask):
+        """
+        Sets the alert mask for the session.
+
+        The mask is staged like apply_settings(), so the session's own view of the
+        alert_mask stays current and categories it relies on are re-enabled when needed.
+
+        Args:
+            mask: The alert mask to set.
+        """
+        self._stage('alert_mask', mask)
+
+    def _stage(self, name, value):
+        """
+        Stages a libtorrent setting, flushing immediately unless inside configure().
+
+        Args:
+            name (str): The settings_pack key.
+            value: The value to install.
+        """
+        with self._lock:
+            self._pending[name] = value
+            if not self._batch_depth:
+                self.flush()
+
+    def _limit_changed(self, new, installed):
+        """
+        Decides whether a new libtorrent rate limit differs enough from the installed one.
+
+        Args:
+            new (int): The encoded limit about to be set.
+            installed (int): The encoded limit currently installed, or None if unknown.
+
+        Returns:
+            bool: True if the new limit should be sent to libtorrent.
+        """
+        if new == installed:
+            return False
+        if installed is None or new <= 1 or installed <= 1:
+            # Unknown state and the unlimited/minimal sentinels always apply.
+            return True
+        return abs(new - installed) > installed * self._rate_hysteresis
+
+    def set_limits(self, download=None, upload=None):
+        """
+        Sets the download and upload rate limits with a single libtorrent call.
+
+        Limits equal to the ones already installed, or within the session's
+        rate_hysteresis of an installed throttle, are skipped, and nothing is sent
+        when neither limit changes. This keeps adaptive shapers that retune every
+        second from rebuilding libtorrent's rate limiter on each small adjustment.
+
+        Args:
+            download (int): Download rate limit in KB/s, or None to leave it unchanged.
+            upload (int): Upload rate limit in KB/s, or None to leave it unchanged.
+                          For both, -1 for minimal rate, 0 for unlimited, positive
+                          integers for specific limits.
+
+        Raises:
+            ValueError: If a rate is outside [-1, MAX_RATE_LIMIT]; nothing is staged then.
+        """
+        if download is not None:
+            self._check_rate(download)
+        if upload is not None:
+            self._check_rate(upload)
+        with self.configure():
+            # Compare against a limit already staged in this batch, else the installed one.
+            pending = self._pending
+            if download is not None:
+                new = self._encode_rate(download)
+                if self._limit_changed(new, pending.get('download_rate_limit', self._dl_cache)):
+                    self._stage('download_rate_limit', new)
+            if upload is not None:
+                new = self._encode_rate(upload)
+                if self._limit_changed(new, pending.get('upload_rate_limit', self._ul_cache)):
+                    self._stage('upload_rate_limit', new)
+
+    def set_download_limit(self, rate=0):
+        """
+        Sets the download rate limit for the session.
+
+        Args:
+            rate (int): Download rate limit in KB/s. 
+                        -1 for minimal rate, 0 for unlimited, positive integers for specific limits.
+        """
+        self.set_limits(download=rate)
+        return self._dl_cache
+
+    def set_upload_limit(self, rate=0):
+        """
+        Sets the upload rate limit for the session.
+
+        Args:
+            rate (int): Upload rate limit in KB/s. 
+                        -1 for minimal rate, 0 for unlimited, positive integers for specific limits.
+        """
+        self.set_limits(upload=rate)
+        return self._ul_cache
+
+    def get_upload_limit(self):
+        """
+        Retrieves the current upload rate limit.
+
+        Returns:
+            int: The upload rate limit in KB/s, -1 for minimal rate, 0 for unlimited.
+        """
+        return self._decode_rate(self._session.upload_rate_limit())
+
+    def get_download_limit(self):
+        """
+        Retrieves the current download rate limit.
+
+        Returns:
+            int: The download rate limit in KB/s, -1 for minimal rate, 0 for unlimited.
+        """
+        return self._decode_rate(self._session.download_rate_limit())
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the session.
+
+        Returns:
+            str: String representation of the session.
+        """
+        return f"Session(user_agent={self._user_agent}, listen_interfaces={self._listen_interfaces}, port={self._port})"
+
+    def __repr__(self):
+        """
+        Returns an unambiguous string representation of the session.
+
+        Returns:
+            str: Detailed string representation of the session.
+        """
+        return self._REPR % (self._user_agent, self._listen_interfaces, self._port,
+                             self._dl_cache, self._ul_cache)
+
+    def __call__(self):
+        """
+        Allows the session object to be called to get its libtorrent session.
+
+        Unlike create_session(), calling the object never replaces the live session.
+
+        Returns:
+            libtorrent.session: The current libtorrent session object.
+        """
+        return self._session
+
+    async def __aenter__(self):
+        """
+        Starts dispatching alerts in the background for the duration of an async with block.
+
+        Returns:
+            Session: The session itself.
+
+        Raises:
+            RuntimeError: If another alert consumer is running.
+        """
+        if self._alert_consumer is not None:
+            raise RuntimeError(f"run() cannot pop alerts while {self._alert_consumer} does")
+        self._alert_task = asyncio.create_task(self.run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        Stops the background alert dispatching started by __aenter__.
+        """
+        task, self._alert_task = self._alert_task, None
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    # Alerts
+
+    def add_alert_handler(self, alert_type, handler):
+        """
+        Registers a handler for alerts of the given type.
+
+        Args:
+            alert_type: The libtorrent alert class to handle, e.g. lt.torrent_finished_alert.
+            handler: Callable invoked with each matching alert.
+        """
+        self._alert_handlers.setdefault(alert_type, []).append(handler)
+
+    def _claim_alerts(self, name, hook=None):
+        """
+        Makes `name` the only consumer popping alerts and installs its notification hook.
+
+        libtorrent invalidates popped alerts on the next pop_alerts(), so two threads
+        draining the same session would hand each other dangling alerts.
+
+        Args:
+            name (str): The consumer, named in the error a competing consumer gets.
+            hook (tuple): Optional (setter name, argument) for libtorrent's notification
+                          hook, e.g. ('set_alert_fd', fd). create_session() installs
+                          it again on the new session.
+
+        Raises:
+            RuntimeError: If another consumer is already popping alerts.
+        """
+        with self._lock:
+            if self._alert_consumer is not None:
+                raise RuntimeError(f"{name} cannot pop alerts while {self._alert_consumer} does")
+            self._alert_consumer = name
+            self._alert_hook = hook
+            if hook is not None:
+                setter, arg = hook
+                getattr(self._session, setter)(arg)
+
+    def _release_alerts(self):
+        """
+        Detaches the notification hook installed by _claim_alerts() and frees alert popping.
+        """
+        with self._lock:
+            if self._alert_hook is not None:
+                self._session.set_alert_notify(lambda: None)
+            self._alert_consumer = self._alert_hook = None
+
+    def _dispatch_alerts(self, alerts):
+        """
+        Passes each alert to the handlers registered for its type.
+
+        Args:
+            alerts (list): Alerts popped from the session.
+
+        Returns:
+            list: The same alerts.
+        """
+        get_handlers = self._alert_handlers.get
+        for alert in alerts:
+            for handler in get_handlers(type(alert), ()):
+                handler(alert)
+        return alerts
+
+    @staticmethod
+    def _params_key(params):
+        """
+        Returns the info hash key matching an add_torrent_alert to its submission.
+
+        Args:
+            params: add_torrent_params object or dict, as submitted or as carried by the alert.
+
+        Returns:
+            str: The info hash as a hex string, or None if the params carry none.
+        """
+        if isinstance(params, dict):
+            ti = params.get('ti')
+            info_hash = ti.info_hash() if ti is not None else params.get('info_hash')
+        else:
+            ti = params.ti
+            info_hash = ti.info_hash() if ti is not None else params.info_hash
+        return str(info_hash) if info_hash is not None else None
+
+    def _on_add_torrent(self, alert):
+        """
+        Records the added torrent's handle and completes the matching add_torrents() future.
+
+        Args:
+            alert: The add_torrent_alert.
+        """
+        key = self._params_key(alert.params)
+        if not alert.error.value():
+            self._handles_by_hash[key] = alert.handle
+            self._restore_leeching_choker(key, alert.handle)
+        with self._lock:
+            futures = self._pending_adds.get(key)
+            if not futures:
+                return
+            future = futures.pop(0)
+            if not futures:
+                del self._pending_adds[key]
+        if future.cancelled():
+            # The caller gave up waiting for this submission.
+            return
+        if alert.error.value():
+            future.set_exception(RuntimeError(alert.error.message()))
+        else:
+            future.set_result(alert.handle)
+
+    def _on_torrent_removed(self, alert):
+        """
+        Forgets the handle and cached status of a removed torrent.
+
+        Removing the last torrent that still downloads switches to the seeding choker.
+
+        Args:
+            alert: The torrent_removed_alert.
+        """
+        key = str(alert.info_hash)
+        self._handles_by_hash.pop(key, None)
+        self._status_cache.pop(key, None)
+        if key in self._leeching:
+            self._leeching.discard(key)
+            self._use_seeding_choker()
+
+    def find_torrent(self, info_hash):
+        """
+        Finds a torrent in the session by its info hash.
+
+        Torrents seen through add_torrent_alert are found with a dict lookup; others,
+        or torrents whose alert has not been drained yet, fall back to libtorrent's
+        own search.
+
+        Args:
+            info_hash: The info hash of the torrent to find.
+
+        Returns:
+            lt.torrent_handle: The torrent handle; invalid if no such torrent exists.
+        """
+        handle = self._handles_by_hash.get(str(info_hash))
+        return handle if handle is not None else self._session.find_torrent(info_hash)
+
+    def submit_torrents(self, torrent_infos):
+        """
+        Submits torrents to the session without waiting for them to be added.
+
+        Every torrent goes through async_add_torrent, so libtorrent parses and
+        checks them on its own thread. Each returned future completes when the
+        matching add_torrent_alert is dispatched, by whichever of drain_alerts(),
+        run(), start_alert_pump() or tick_status() pops it. Status notifications are
+        added to the session's alert_mask if missing, since the alert is posted
+        under that category.
+
+        Args:
+            torrent_infos (list): add_torrent_params objects or dicts to add, each with
+                                  a 'ti' torrent_info or an 'info_hash'.
+
+        Returns:
+            list: A concurrent.futures.Future per torrent, in submission order, that
+                  resolves to its lt.torrent_handle or raises RuntimeError if
+                  libtorrent failed to add it.
+
+        Raises:
+            ValueError: If a torrent has neither a torrent_info nor an info hash.
+        """
+        keys = [self._params_key(torrent_info) for torrent_info in torrent_infos]
+        if None in keys:
+            raise ValueError("torrents need a 'ti' torrent_info or an 'info_hash' to be added")
+        if not self._settings['alert_mask'] & _STATUS_MASK:
+            self._stage('alert_mask', self._settings['alert_mask'] | _STATUS_MASK)
+        futures = []
+        for key, torrent_info in zip(keys, torrent_infos):
+            future = concurrent.futures.Future()
+            # The alert thread pops these lists, so register under the lock.
+            with self._lock:
+                self._pending_adds.setdefault(key, []).append(future)
+            self._session.async_add_torrent(torrent_info)
+            futures.append(future)
+        return futures
+
+    def _check_outside_batch(self, name):
+        """
+        Refuses to wait for alerts inside the calling thread's configure() block.
+
+        The block holds the settings lock, which alert handlers take to stage
+        settings, so the thread dispatching the awaited alert would stall on it.
+
+        Args:
+            name (str): The waiting method, named in the error.
+
+        Raises:
+            RuntimeError: If the calling thread is inside configure().
+        """
+        # Once the lock is acquired, a non-zero depth can only be this thread's own batch.
+        with self._lock:
+            if self._batch_depth:
+                raise RuntimeError(f"{name} cannot wait for alerts inside configure()")
+
+    def add_torrents(self, torrent_infos, timeout=30.0):
+        """
+        Adds several torrents to the session and waits until all of them are in.
+
+        The torrents are submitted together with submit_torrents(). While an alert
+        consumer is running (the alert pump, the incremental status thread, run() or
+        an alert eventfd), it completes the futures, so do not call this from that
+        consumer's own thread; otherwise this call drains alerts itself. Alerts it drains only
+        reach the registered handlers: libtorrent invalidates popped alerts on the
+        next pop, so they cannot be kept for a later drain_alerts() call. Register
+        a handler with add_alert_handler() for alerts that must not be missed.
+
+        Args:
+            torrent_infos (list): add_torrent_params objects or dicts to add.
+            timeout (float): Seconds to wait for all torrents to be added.
+
+        Returns:
+            list: The lt.torrent_handle of each torrent, in submission order.
+
+        Raises:
+            RuntimeError: If libtorrent failed to add one of the torrents.
+            TimeoutError: If the torrents were not all added within `timeout`; the
+                          submissions still pending are cancelled.
+        """
+        self._check_outside_batch('add_torrents()')
+        futures = self.submit_torrents(torrent_infos)
+        deadline = time.monotonic() + timeout
+        background = self._alert_consumer is not None
+        while not all(future.done() for future in futures):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for future in futures:
+                    future.cancel()
+                raise TimeoutError(f"torrents were not added within {timeout} seconds")
+            if background:
+                concurrent.futures.wait(futures, remaining)
+            else:
+                self._session.wait_for_alert(int(min(remaining, 0.1) * 1000))
+                self._dispatch_alerts(self._session.pop_alerts())
+        return [future.result() for future in futures]
+
+    async def add_torrents_async(self, torrent_infos, timeout=30.0):
+        """
+        Adds several torrents without blocking the running event loop.
+
+        Inside `async with session:` the futures are completed by run() on this
+        loop; otherwise add_torrents() waits in a worker thread.
+
+        Args:
+            torrent_infos (list): add_torrent_params objects or dicts to add.
+            timeout (float): Seconds to wait for all torrents to be added.
+
+        Returns:
+            list: The lt.torrent_handle of each torrent, in submission order.
+        """
+        self._check_outside_batch('add_torrents_async()')
+        if self._alert_task is None:
+            return await asyncio.to_thread(self.add_torrents, torrent_infos, timeout)
+        futures = self.submit_torrents(torrent_infos)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*[asyncio.wrap_future(future) for future in futures]), timeout)
+        except asyncio.TimeoutError:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def add_torrent(self, torrent_info, timeout=30.0):
+        """
+        Adds a torrent to the session.
+
+        Args:
+            torrent_info: The torrent information to add.
+            timeout (float): Seconds to wait for the torrent to be added.
+
+        Returns:
+            lt.torrent_handle: The handle to the added torrent.
+        """
+        return self.add_torrents([torrent_info], timeout)[0]
+
+    def _on_state_update(self, alert):
+        """
+        Stores the statuses carried by a state_update_alert in the status cache.
+
+        Args:
+            alert: The state_update_alert.
+        """
+        cache = self._status_cache
+        for status in alert.status:
+            cache[str(status.handle.info_hash())] = status
+
+    def enable_incremental_status(self, interval=1.0):
+        """
+        Keeps torrent statuses up to date from libtorrent's state updates instead of polling.
+
+        A background thread calls tick_status() every `interval` seconds, which also
+        drains and dispatches all other pending alerts on that thread, so no separate
+        alert loop is needed alongside it; starting one raises RuntimeError.
+
+        Args:
+            interval (float): Seconds between state update requests.
+
+        Raises:
+            RuntimeError: If another alert consumer is running.
+        """
+        if self._status_timer is not None:
+            return
+        self._claim_alerts('enable_incremental_status()')
+        if not self._settings['alert_mask'] & _STATUS_MASK:
+            self._stage('alert_mask', self._settings['alert_mask'] | _STATUS_MASK)
+        stop = threading.Event()
+
+        def post_updates():
+            while not stop.wait(interval):
+                self.tick_status()
+
+        thread = threading.Thread(target=post_updates, name='status-updates', daemon=True)
+        self._status_timer = (thread, stop)
+        thread.start()
+
+    def tick_status(self, timeout=50):
+        """
+        Requests state updates and processes the resulting alerts in the same pass.
+
+        libtorrent answers post_torrent_updates() with a state_update_alert holding
+        only the torrents whose status changed; the call waits up to `timeout`
+        milliseconds for alerts and drains them at once, so the statuses land in the
+        cache read by get_torrent_status().
+
+        Args:
+            timeout (int): Milliseconds to wait for the state update to arrive.
+
+        Returns:
+            list: The alerts drained during this tick.
+        """
+        self._session.post_torrent_updates()
+        self._session.wait_for_alert(timeout)
+        return self.drain_alerts()
+
+    def disable_incremental_status(self):
+        """
+        Stops the state update requests started by enable_incremental_status().
+
+        The cached statuses are dropped with it, so get_torrent_status() goes back
+        to querying libtorrent instead of serving statuses that no longer update.
+        """
+        if self._status_timer is None:
+            return
+        thread, stop = self._status_timer
+        self._status_timer = None
+        stop.set()
+        thread.join()
+        self._release_alerts()
+        self._status_cache.clear()
+
+    def get_torrent_status(self, torrent_handle):
+        """
+        Retrieves the status of a specific torrent.
+
+        Served from the status cache filled by enable_incremental_status(); torrents
+        without a cached status yet are queried from libtorrent directly.
+
+        Args:
+            torrent_handle: The handle of the torrent.
+
+        Returns:
+            libtorrent.torrent_status: The torrent status object.
+        """
+        status = self._status_cache.get(str(torrent_handle.info_hash()))
+        return status if status is not None else torrent_handle.status()
+
+    def _on_dht_peers(self, alert):
+        """
+        Caches the peers returned by a DHT lookup for dht_cache_ttl seconds.
+
+        Every entry lives for the same TTL and a refreshed key is moved to the end,
+        so the dict stays in expiry order: expired entries and any overflow beyond
+        dht_cache_size are evicted from the front on each insert.
+
+        Args:
+            alert: The dht_get_peers_reply_alert.
+        """
+        cache = self._dht_peers_cache
+        now = time.monotonic()
+        key = str(alert.info_hash)
+        cache.pop(key, None)
+        cache[key] = (now + self._dht_cache_ttl, alert.peers())
+        while cache:
+            oldest = next(iter(cache))
+            if cache[oldest][0] > now and len(cache) <= self._dht_cache_size:
+                break
+            cache.pop(oldest, None)
+
+    def dht_get_peers(self, info_hash):
+        """
+        Retrieves peers for a torrent from the DHT.
+
+        A lookup answered within the last dht_cache_ttl seconds is served from the
+        cache. Otherwise a new DHT lookup is started; its peers arrive as a
+        dht_get_peers_reply_alert and are cached for later calls. DHT operation
+        notifications are added to the session's alert_mask if missing, since the
+        reply is posted under that category.
+
+        Args:
+            info_hash: The info hash of the torrent.
+
+        Returns:
+            list: A copy of the cached peers as (ip, port) tuples, or None if a lookup
+                  was started.
+        """
+        key = str(info_hash)
+        hit = self._dht_peers_cache.get(key)
+        if hit is not None:
+            if hit[0] > time.monotonic():
+                return list(hit[1])
+            self._dht_peers_cache.pop(key, None)
+        if not self._settings['alert_mask'] & _DHT_OPERATION_MASK:
+            self._stage('alert_mask', self._settings['alert_mask'] | _DHT_OPERATION_MASK)
+        self._session.dht_get_peers(info_hash)
+        return None
+
+    @staticmethod
+    def dht_sample_infohashes_flat(samples):
+        """
+        Packs DHT info hash samples into one contiguous buffer.
+
+        Args:
+            samples (list): sha1_hash samples, e.g. dht_sample_infohashes_alert.samples.
+
+        Returns:
+            memoryview: A (len(samples), 20) view of unsigned bytes over a single
+                        buffer; numpy.asarray() wraps it without copying, so XOR
+                        distances can be computed for all samples at once. With
+                        no samples the view is empty and one-dimensional, since
+                        memoryview cannot have a zero-length dimension.
+        """
+        buf = b''.join([sample.to_bytes() for sample in samples])
+        if not buf:
+            return memoryview(buf)
+        return memoryview(buf).cast('B', (len(samples), 20))
+
+    def _on_torrent_finished(self, alert):
+        """
+        Switches from the rate based choker to a seeding friendly one once nothing is leeching.
+
+        Args:
+            alert: The torrent_finished_alert.
+        """
+        self._leeching.discard(str(alert.handle.info_hash()))
+        self._use_seeding_choker()
+
+    def _use_seeding_choker(self):
+        """
+        Installs fixed slots with round robin seeding once no tracked torrent downloads.
+
+        The rate based choker is kept while any torrent added through the session
+        still downloads; once all of them are finished it throttles uploads, so fixed
+        slots with round robin seeding take over. The leeching torrents are tracked
+        from the add, finished and removed alerts, so no torrent is polled here. The
+        configured unchoke_slots_limit is left as it is.
+        """
+        if self._seeding_choker or self._leeching:
+            return
+        self._seeding_choker = True
+        with self.configure():
+            self._stage('choking_algorithm', self._lt.choking_algorithm_t.fixed_slots_choker)
+            self._stage('seed_choking_algorithm', self._lt.seed_choking_algorithm_t.round_robin)
+
+    def _restore_leeching_choker(self, key, handle):
+        """
+        Tracks an added torrent that still downloads and switches back to the rate based choker.
+
+        Args:
+            key (str): The info hash of the added torrent.
+            handle: The handle of the added torrent.
+        """
+        if handle.status().is_finished:
+            return
+        self._leeching.add(key)
+        if self._seeding_choker:
+            self._seeding_choker = False
+            self._stage('choking_algorithm', self._lt.choking_algorithm_t.rate_based_choker)
+
+    def drain_alerts(self, category=None):
+        """
+        Pops every pending alert in one call and dispatches it to the registered handlers.
+
+        Args:
+            category (int): Optional alert category bitmask; only alerts in these
+                            categories are returned. Categories outside the session's
+                            alert_mask are never posted by libtorrent in the first place.
+
+        The returned alerts stay valid only until the next pop, by this or any
+        other drain.
+
+        Returns:
+            list: The popped alerts, filtered by category when one is given.
+        """
+        alerts = self._dispatch_alerts(self._session.pop_alerts())
+        if category is None:
+            return alerts
+        return [alert for alert in alerts if alert.category() & category]
+
+    def open_alert_eventfd(self):
+        """
+        Creates a non-blocking eventfd that is signalled when alerts are pending.
+
+        libtorrent's own set_alert_fd() writes a single byte, which an eventfd
+        rejects, so a notify callback adds 1 to the eventfd counter instead. The
+        descriptor can be registered with the caller's own event machinery, such as
+        an io_uring IORING_OP_POLL_ADD, epoll or asyncio's loop.add_reader(), so
+        alert readiness is reaped together with other completions. On readiness,
+        os.eventfd_read() the counter and call drain_alerts(). Close it with
+        close_alert_eventfd(). Linux only. The caller becomes the session's alert
+        consumer, so run(), start_alert_pump() and enable_incremental_status() raise
+        RuntimeError until then.
+
+        Returns:
+            int: The eventfd file descriptor.
+
+        Raises:
+            RuntimeError: If another alert consumer is running.
+        """
+        efd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        try:
+            self._claim_alerts('open_alert_eventfd()', ('set_alert_notify', lambda: os.eventfd_write(efd, 1)))
+        except RuntimeError:
+            os.close(efd)
+            raise
+        return efd
+
+    def close_alert_eventfd(self, efd):
+        """
+        Detaches and closes an eventfd created by open_alert_eventfd().
+
+        Args:
+            efd (int): The eventfd file descriptor.
+        """
+        self._release_alerts()
+        os.close(efd)
+
+    def start_alert_pump(self, handler=None):
+        """
+        Dispatches alerts from a background thread that only wakes when alerts exist.
+
+        libtorrent writes a byte to a pipe when its alert queue becomes non-empty;
+        the thread blocks reading it and drains the whole queue once per wake-up, so
+        an idle session costs no CPU. A pipe rather than an eventfd, since libtorrent
+        writes a single byte and an eventfd rejects writes shorter than 8 bytes. Alert
+        handlers run on that thread. The pump is the session's only alert consumer
+        while it runs.
+
+        Args:
+            handler: Optional callable invoked with each non-empty batch of alerts,
+                     after the registered alert handlers.
+
+        Raises:
+            RuntimeError: If another alert consumer is running.
+        """
+        if self._alert_pump is not None:
+            return
+        read_fd, write_fd = os.pipe()
+        # A full pipe already means a wake-up is pending; never block libtorrent's thread.
+        os.set_blocking(write_fd, False)
+        stop = threading.Event()
+
+        def pump():
+            while not stop.is_set():
+                alerts = self.drain_alerts()
+                if handler is not None and alerts:
+                    handler(alerts)
+                # Consume every notification written since the last drain at once.
+                os.read(read_fd, 4096)
+
+        try:
+            self._claim_alerts('start_alert_pump()', ('set_alert_fd', write_fd))
+        except RuntimeError:
+            os.close(read_fd)
+            os.close(write_fd)
+            raise
+        thread = threading.Thread(target=pump, name='alert-pump', daemon=True)
+        self._alert_pump = (thread, stop, read_fd, write_fd)
+        thread.start()
+
+    def stop_alert_pump(self):
+        """
+        Stops the thread started by start_alert_pump() and closes its file descriptors.
+        """
+        if self._alert_pump is None:
+            return
+        thread, stop, read_fd, write_fd = self._alert_pump
+        self._alert_pump = None
+        stop.set()
+        with contextlib.suppress(BlockingIOError):
+            os.write(write_fd, b'\0')
+        thread.join()
+        # Detach libtorrent from the pipe before closing it.
+        self._release_alerts()
+        os.close(read_fd)
+        os.close(write_fd)
+
+    async def run(self):
+        """
+        Dispatches alerts to the registered handlers until cancelled.
+
+        Instead of polling, the coroutine sleeps until libtorrent signals that the
+        alert queue became non-empty and then drains the whole queue in one batch.
+
+        Raises:
+            RuntimeError: If another alert consumer is running.
+        """
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self._claim_alerts('run()', ('set_alert_notify', lambda: loop.call_soon_threadsafe(wakeup.set)))
+        try:
+            while True:
+                self.drain_alerts()
+                await wakeup.wait()
+                wakeup.clear()
+        finally:
+            self._release_alerts()
+
+    # Additional Methods
+
+    def set_download_rate_limit(self, rate):
+        """
+        Sets the global download rate limit.
+
+        Args:
+            rate (int): Download rate limit in bytes per second.
+        """
+        self._stage('download_rate_limit', rate)
+        return rate
+
+    def set_local_download_rate_limit(self, rate):
+        """
+        Sets the local download rate limit.
+
+        Args:
+            rate (int): Local download rate limit in bytes per second.
+        """
+        self._session.set_local_download_rate_limit(rate)
+        return self._session.local_download_rate_limit()
+
+    def set_local_upload_rate_limit(self, rate):
+        """
+        Sets the local upload rate limit.
+
+        Args:
+            rate (int): Local upload rate limit in bytes per second.
+        """
+        self._session.set_local_upload_rate_limit(rate)
+        return self._session.local_upload_rate_limit()
+
+    def set_max_connections(self, max_conn):
+        """
+        Sets the maximum number of connections allowed.
+
+        Args:
+            max_conn (int): Maximum number of connections.
+        """
+        self._stage('connections_limit', max_conn)
+        return max_conn
+
+    def set_max_half_open_connections(self, max_half_open):
+        """
+        Sets the maximum number of half-open connections.
+
+        Args:
+            max_half_open (int): Maximum number of half-open connections.
+        """
+        self._session.set_max_half_open_connections(max_half_open)
+        return self._session.max_half_open_connections()
+
+    def set_max_uploads(self, max_uploads):
+        """
+        Sets the maximum number of simultaneous uploads.
+
+        Args:
+            max_uploads (int): Maximum number of uploads.
+        """
+        self._stage('unchoke_slots_limit', max_uploads)
+        return max_uploads
+
+    def set_pe_settings(self, pe_settings):
+        """
+        Sets the peer-to-peer settings for the session.
+
+        Args:
+            pe_settings: The P2P settings to apply.
+        """
+        self._session.set_pe_settings(pe_settings)
+        return self._session.get_pe_settings()
+
+    def set_peer_class(self, peer_class_id, peer_class):
+        """
+        Sets a peer class with the given ID.
+
+        Args:
+            peer_class_id (int): The ID of the peer class.
+            peer_class: The peer class to set.
+        """
+        self._session.set_peer_class(peer_class_id, peer_class)
+        return self._session.get_peer_class(peer_class_id)
+
+    def set_peer_class_filter(self, filter):
+        """
+        Sets the peer class filter.
+
+        Args:
+            filter: The filter to apply to peer classes.
+        """
+        self._session.set_peer_class_filter(filter)
+        return self._session.get_peer_class_filter()
+
+    def set_peer_class_type_filter(self, type_filter):
+        """
+        Sets the peer class type filter.
+
+        Args:
+            type_filter: The type filter to apply.
+        """
+        self._session.set_peer_class_type_filter(type_filter)
+        return self._session.get_peer_class_type_filter()
+
+    def set_peer_id(self, peer_id):
+        """
+        Sets the peer ID for the session.
+
+        Args:
+            peer_id (bytes): The peer ID to set.
+        """
+        self._session.set_peer_id(peer_id)
+        return self._session.get_peer_id()
+
+    def set_upload_rate_limit(self, rate):
+        """
+        Sets the global upload rate limit.
+
+        Args:
+            rate (int): Upload rate limit in bytes per second.
+        """
+        self._stage('upload_rate_limit', rate)
+        return rate
+
+
+# libtorrent session methods Session exposes unchanged. Each gets a plain method on the
+# class, so a call costs one Python frame and no failed attribute lookup, and the
+# libtorrent session is looked up per call because create_session() may replace it.
+_FORWARDED = (
+    'add_dht_node', 'add_dht_router', 'add_extension', 'add_port_mapping',
+    'async_add_torrent', 'create_peer_class', 'delete_files', 'delete_partfile',
+    'delete_peer_class', 'delete_port_mapping', 'dht_announce', 'dht_get_immutable_item',
+    'dht_get_mutable_item', 'dht_live_nodes', 'dht_proxy', 'dht_put_immutable_item',
+    'dht_put_mutable_item', 'dht_sample_infohashes', 'dht_state', 'download_rate_limit',
+    'get_dht_settings', 'get_ip_filter', 'get_pe_settings', 'get_peer_class',
+    'get_settings', 'get_torrents', 'global_peer_class_id', 'i2p_proxy', 'id',
+    'is_dht_running', 'is_listening', 'is_paused', 'listen_on', 'listen_port', 'load_state',
+    'local_download_rate_limit', 'local_peer_class_id', 'local_upload_rate_limit',
+    'max_connections', 'num_connections', 'outgoing_ports', 'pause', 'peer_proxy',
+    'pop_alerts', 'post_dht_stats', 'post_session_stats', 'post_torrent_updates',
+    'refresh_torrent_status', 'remove_torrent', 'reopen_map_ports',
+    'reopen_network_sockets', 'resume', 'save_state', 'set_alert_fd', 'set_alert_notify',
+    'set_alert_queue_size_limit', 'set_dht_proxy', 'set_dht_settings', 'set_i2p_proxy',
+    'set_ip_filter', 'set_peer_proxy', 'set_proxy', 'set_tracker_proxy',
+    'set_web_seed_proxy', 'ssl_listen_port', 'start_dht', 'start_lsd', 'start_natpmp',
+    'start_upnp', 'status', 'stop_dht', 'stop_lsd', 'stop_natpmp', 'stop_upnp', 'tcp',
+    'tcp_peer_class_id', 'tracker_proxy', 'udp', 'upload_rate_limit', 'wait_for_alert',
+    'web_seed_proxy',
+)
+
+
+def _forwarder(name):
+    """
+    Builds a Session method that calls the libtorrent session method of the same name.
+
+    Args:
+        name (str): The libtorrent session method name.
+
+    Returns:
+        function: The forwarding method.
+    """
+    def forward(self, *args, **kwargs):
+        return getattr(self._session, name)(*args, **kwargs)
+
+    forward.__name__ = name
+    forward.__qualname__ = f'Session.{name}'
+    forward.__doc__ = f"Calls libtorrent's session.{name}() on the current session."
+    return forward
+
+
+for _name in _FORWARDED:
+    setattr(Session, _name, _forwarder(_name))
+del _name
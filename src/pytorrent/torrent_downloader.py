@@ -1,6 +1,6 @@
-from session import Session
-from torrent_info import TorrentInfo
-from downloader import Downloader
+from .session import Session
+from .torrent_info import TorrentInfo
+from .downloader import Downloader
 import libtorrent as lt
 
 
@@ -26,14 +26,13 @@ class TorrentDownloader:
             )
 
         else:
-            self._torrent_info = TorrentInfo(self._file_path, self._lt)
+            self._torrent_info = TorrentInfo(self._file_path, self._lt, session=self._session)
             self._downloader = Downloader(
                 session=self._session(), torrent_info=self._torrent_info(), 
                 save_path=self._save_path, libtorrent=None, is_magnet=False
             )
 
-        self._session.set_download_limit(download_speed)
-        self._session.set_upload_limit(upload_speed)
+        self._session.set_limits(download_speed, upload_speed)
 
         self._file = self._downloader
         await self._file.download()
@@ -49,12 +48,3 @@ class TorrentDownloader:
     def stop_download(self):
         if self._downloader:
             self._downloader.stop()
-
-    def __str__(self):
-        pass
-
-    def __repr__(self):
-        pass
-
-    def __call__(self):
-        pass
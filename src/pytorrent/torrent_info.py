@@ -0,0 +1,334 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import starmap
+from operator import attrgetter
+import json
+import os
+import sys
+from typing import Iterator, List, Optional, Tuple
+from .session import Session
+
+
+@dataclass(slots=True, frozen=True)
+class FileInfo:
+    # Information about a file in the torrent
+    file_name: Optional[str] = None
+    size: Optional[int] = None
+    offset: Optional[int] = None
+    mtime: Optional[float] = None
+    executable_attribute: Optional[bool] = None
+    hidden_attribute: Optional[bool] = None
+    pad_file: Optional[bool] = None
+    path: Optional[str] = None
+    symlink_attribute: Optional[bool] = None
+    symlink_path: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    def __getstate__(self) -> tuple:
+        # Pickle as a flat tuple of field values in declaration order
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __setstate__(self, state: tuple) -> None:
+        # Frozen instances are filled the way the dataclass __init__ does it
+        for name, value in zip(self._FIELDS, state):
+            object.__setattr__(self, name, value)
+
+# Field names in declaration order, computed once per class for as_dict and pickling
+FileInfo._FIELDS = tuple(FileInfo.__dataclass_fields__)
+
+@dataclass(slots=True, frozen=True)
+class TrackerInfo:
+    # Information about a tracker in the torrent
+    complete_sent: Optional[bool] = None
+    fail_limit: Optional[int] = None
+    fails: Optional[int] = None
+    message: Optional[str] = None
+    min_announce: Optional[int] = None
+    next_announce: Optional[int] = None
+    scrape_complete: Optional[int] = None
+    scrape_downloaded: Optional[int] = None
+    scrape_incomplete: Optional[int] = None
+    source: Optional[str] = None
+    tier: Optional[int] = None
+    trackerid: Optional[str] = None
+    updating: Optional[bool] = None
+    url: Optional[str] = None
+    verified: Optional[bool] = None
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    def __getstate__(self) -> tuple:
+        # Pickle as a flat tuple of field values in declaration order
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __setstate__(self, state: tuple) -> None:
+        # Frozen instances are filled the way the dataclass __init__ does it
+        for name, value in zip(self._FIELDS, state):
+            object.__setattr__(self, name, value)
+
+TrackerInfo._FIELDS = tuple(TrackerInfo.__dataclass_fields__)
+
+@dataclass(slots=True, frozen=True)
+class Info:
+    # General information about the torrent
+    name: Optional[str] = None
+    comment: Optional[str] = None
+    creation_date: Optional[int] = None
+    creator: Optional[str] = None
+    files_list: Optional[Tuple[FileInfo, ...]] = None
+    is_i2p: Optional[bool] = None
+    is_merkle_torrent: Optional[bool] = None
+    is_valid: Optional[bool] = None
+    metadata_size: Optional[int] = None
+    nodes: Optional[Tuple[str, ...]] = None
+    num_files: Optional[int] = None
+    num_pieces: Optional[int] = None
+    piece_length: Optional[int] = None
+    priv: Optional[bool] = None
+    total_size: Optional[int] = None
+    trackers: Optional[Tuple[TrackerInfo, ...]] = None
+    web_seeds: Optional[Tuple[str, ...]] = None
+    num_seeds: Optional[int] = None  # Number of connected seeds
+    num_peers: Optional[int] = None  # Number of connected peers
+
+    def as_dict(self) -> dict:
+        # Fields hold only primitives and tuples, so turning the tuples into lists detaches the dict
+        data = {name: getattr(self, name) for name in self._FIELDS}
+        if self.files_list is not None:
+            data["files_list"] = [f.as_dict() for f in self.files_list]
+        if self.trackers is not None:
+            data["trackers"] = [t.as_dict() for t in self.trackers]
+        if self.nodes is not None:
+            data["nodes"] = list(self.nodes)
+        if self.web_seeds is not None:
+            data["web_seeds"] = list(self.web_seeds)
+        return data
+
+    def __getstate__(self) -> tuple:
+        # Nested records pickle through their own __getstate__
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __setstate__(self, state: tuple) -> None:
+        # Frozen instances are filled the way the dataclass __init__ does it
+        for name, value in zip(self._FIELDS, state):
+            object.__setattr__(self, name, value)
+
+Info._FIELDS = tuple(Info.__dataclass_fields__)
+
+# Defaults for attributes a libtorrent build may not expose, in TrackerInfo field order
+_TRACKER_DEFAULTS = (
+    ("complete_sent", False), ("fail_limit", 0), ("fails", 0), ("message", ""),
+    ("min_announce", 0), ("next_announce", 0), ("scrape_complete", 0),
+    ("scrape_downloaded", 0), ("scrape_incomplete", 0), ("source", ""), ("tier", 0),
+    ("trackerid", ""), ("updating", False), ("url", ""), ("verified", False),
+)
+_FILE_DEFAULTS = (
+    ("mtime", 0.0), ("executable_attribute", False), ("hidden_attribute", False),
+    ("pad_file", False), ("symlink_attribute", False), ("symlink_path", ""),
+)
+
+# Fetch every attribute of an entry in one call, names match the dataclass fields
+_TRACKER_GET = attrgetter(*TrackerInfo._FIELDS)
+_FILE_GET = attrgetter("path", "size", "offset", *(name for name, _ in _FILE_DEFAULTS))
+
+def _json_default(o) -> dict:
+    # json.dumps hook: serialize the info dataclasses field by field, nested ones lazily
+    fields = getattr(o, "_FIELDS", None)
+    if fields is None:
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+    return {name: getattr(o, name) for name in fields}
+
+def _tracker_fields_with_defaults(tracker) -> tuple:
+    # Fallback for bindings built without the deprecated announce_entry stats
+    return tuple(getattr(tracker, name, default) for name, default in _TRACKER_DEFAULTS)
+
+def _file_fields_with_defaults(f) -> tuple:
+    # Fallback for bindings whose file entries lack some optional attributes
+    return (f.path, f.size, f.offset, *[getattr(f, name, default) for name, default in _FILE_DEFAULTS])
+
+_URL_INDEX = TrackerInfo._FIELDS.index("url")
+
+def _tracker_rows(torrent_info) -> Iterator[list]:
+    # One list of TrackerInfo field values per tracker, shared by the record and dict parsers
+    get_fields = _TRACKER_GET
+    intern = sys.intern
+    for tracker in torrent_info.trackers():
+        try:
+            fields = get_fields(tracker)
+        except AttributeError:
+            # Switch to the defaulting reader for the remaining entries
+            get_fields = _tracker_fields_with_defaults
+            fields = get_fields(tracker)
+        # The same few announce URLs recur across every torrent parsed in a process
+        row = list(fields)
+        row[_URL_INDEX] = intern(row[_URL_INDEX])
+        yield row
+
+def _file_rows(torrent_info) -> Iterator[tuple]:
+    # One tuple of FileInfo field values per file, shared by the record and dict parsers
+    get_fields = _FILE_GET
+    for f in torrent_info.files():
+        try:
+            fields = get_fields(f)
+        except AttributeError:
+            get_fields = _file_fields_with_defaults
+            fields = get_fields(f)
+        path, size, offset, mtime, executable, hidden, pad_file, symlink, symlink_path = fields
+        # libtorrent joins path components with "/" on POSIX, the only platform we support
+        yield (path.rpartition("/")[2], size, offset, mtime, executable, hidden,
+               pad_file, path, symlink, symlink_path)
+
+class TorrentInfo:
+    def __init__(self, path: str, libtorrent, session: Optional[Session] = None):
+        # Only parse the metadata; the torrent is never added to the session here, which
+        # is only consulted for peer counts once something else has added the torrent
+        self._path = path
+        self._lt = libtorrent
+        self._info = self._lt.torrent_info(self._path)
+        self._info_cache: Optional[Info] = None
+        self._session = session
+
+    def __call__(self):
+        """Return the parsed libtorrent torrent_info"""
+        return self._info
+
+    @property
+    def status(self):
+        """Status of this torrent in the session, None while it has not been added"""
+        handle = self._find_handle()
+        return handle.status() if handle is not None else None
+
+    def _find_handle(self):
+        """Return the session's handle for this torrent, or None"""
+        if self._session is None:
+            return None
+        handle = self._session.find_torrent(self._info.info_hash())
+        return handle if handle is not None and handle.is_valid() else None
+
+    def _peer_counts(self) -> tuple:
+        """Return (num_seeds, num_peers), both None while the torrent is not in the session"""
+        status = self.status
+        return (status.num_seeds, status.num_peers) if status is not None else (None, None)
+
+    @classmethod
+    def batch_parse(cls, paths, libtorrent, session: Optional[Session] = None,
+                    workers: Optional[int] = None) -> List["TorrentInfo"]:
+        """Parse several torrent files on a thread pool"""
+        # The parses only run side by side where the libtorrent build releases the GIL
+        # while reading and decoding; otherwise this is no slower than parsing in a loop
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(lambda path: cls(path, libtorrent, session=session), paths))
+
+    def reload(self) -> None:
+        """Re-parse the torrent file from disk"""
+        self._info = self._lt.torrent_info(self._path)
+        self._info_cache = None
+
+    def invalidate(self) -> None:
+        """Drop the cached Info so the next call rebuilds it"""
+        self._info_cache = None
+
+    def info_as_dict(self) -> dict:
+        """Return torrent information as a dictionary"""
+        # Scalars come from the cached Info, the lists straight from the rows without
+        # building FileInfo/TrackerInfo records only to turn them into dicts
+        info = self.create_torrent_info(include_files=False, include_trackers=False)
+        data = replace(info, files_list=None, trackers=None).as_dict()
+        data["files_list"] = self.parse_file_info_as_dict(self._info)
+        data["trackers"] = self.parse_tracker_info_as_dict(self._info)
+        return data
+
+    def info_as_json(self, **kwargs) -> str:
+        """Return torrent information as a JSON string"""
+        # With orjson installed, orjson.dumps(self.create_torrent_info()) is faster still,
+        # it serializes dataclasses natively without building any dict
+        return json.dumps(self.create_torrent_info(), default=_json_default, **kwargs)
+
+    def show_info(self) -> None:
+        """Print torrent information"""
+        # Headline metadata only, the file and tracker lists are summarized by count
+        info = self.create_torrent_info(include_files=False, include_trackers=False)
+        for name in Info._FIELDS:
+            value = getattr(info, name)
+            if name == "files_list":
+                value = f"{info.num_files} entries"
+            elif name == "trackers":
+                # Count the cached trackers when some call already built them; otherwise walk
+                # trackers(), which the bindings hand back as an iterator without len()
+                trackers = info.trackers
+                count = len(trackers) if trackers is not None else sum(1 for _ in self._info.trackers())
+                value = f"{count} entries"
+            print(f"{name}: {value}")
+
+    def create_torrent_info(self, include_files: bool = True, include_trackers: bool = True) -> Info:
+        """Return the cached Info for this torrent with live peer counts, building it on first use"""
+        info = self._info_cache
+        if info is None:
+            info = self._build_scalar_info()
+            num_seeds, num_peers = info.num_seeds, info.num_peers
+        else:
+            # Metadata is immutable once parsed, only the peer counts move
+            num_seeds, num_peers = self._peer_counts()
+        # Skipped lists stay None until a caller asks for them, then they are cached too
+        if include_files and info.files_list is None:
+            info = replace(info, files_list=tuple(self.iter_file_info()))
+        if include_trackers and info.trackers is None:
+            info = replace(info, trackers=tuple(self.iter_tracker_info()))
+        self._info_cache = info
+        # The records are frozen and the lists are tuples, so callers can share them
+        return replace(info, num_seeds=num_seeds, num_peers=num_peers)
+
+    def _build_scalar_info(self) -> Info:
+        """Create an Info object without the file and tracker lists"""
+        # Reuse the metadata parsed in __init__, reload() re-reads the file
+        torrent_info = self._info
+        num_seeds, num_peers = self._peer_counts()
+        return Info(
+            name=torrent_info.name(),
+            comment=torrent_info.comment(),
+            creation_date=torrent_info.creation_date(),
+            creator=torrent_info.creator(),
+            is_i2p=torrent_info.is_i2p(),
+            is_merkle_torrent=torrent_info.is_merkle_torrent(),
+            is_valid=torrent_info.is_valid(),
+            metadata_size=torrent_info.metadata_size(),
+            nodes=tuple(torrent_info.nodes()),
+            num_files=torrent_info.num_files(),
+            num_pieces=torrent_info.num_pieces(),
+            piece_length=torrent_info.piece_length(),
+            priv=torrent_info.priv(),
+            total_size=torrent_info.total_size(),
+            web_seeds=tuple(torrent_info.web_seeds()),
+            num_seeds=num_seeds,
+            num_peers=num_peers
+        )
+
+    def parse_tracker_info(self, torrent_info) -> List[TrackerInfo]:
+        """Extract tracker information from torrent metadata"""
+        return list(self.iter_tracker_info(torrent_info))
+
+    def parse_file_info(self, torrent_info) -> List[FileInfo]:
+        """Extract file information from torrent metadata"""
+        return list(self.iter_file_info(torrent_info))
+
+    def parse_tracker_info_as_dict(self, torrent_info) -> List[dict]:
+        """Extract tracker information as dicts, skipping the TrackerInfo records"""
+        names = TrackerInfo._FIELDS
+        return [dict(zip(names, row)) for row in _tracker_rows(torrent_info)]
+
+    def parse_file_info_as_dict(self, torrent_info) -> List[dict]:
+        """Extract file information as dicts, skipping the FileInfo records"""
+        names = FileInfo._FIELDS
+        return [dict(zip(names, row)) for row in _file_rows(torrent_info)]
+
+    def iter_tracker_info(self, torrent_info=None) -> Iterator[TrackerInfo]:
+        """Yield tracker information one entry at a time"""
+        return starmap(TrackerInfo, _tracker_rows(self._info if torrent_info is None else torrent_info))
+
+    def iter_file_info(self, torrent_info=None) -> Iterator[FileInfo]:
+        """Yield file information one entry at a time"""
+        # Positional arguments in FileInfo field order skip keyword binding per file
+        return starmap(FileInfo, _file_rows(self._info if torrent_info is None else torrent_info))
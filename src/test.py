@@ -1,4 +1,4 @@
-from client import Torrent
+from pytorrent.client import Torrent
 
 
 file_path = "/home/elon/Downloads/That Christmas (2024) NF WEB-DL 1080p [UKR_ENG] [Hurtom].mkv.torrent"